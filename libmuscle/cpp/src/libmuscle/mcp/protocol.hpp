@@ -19,6 +19,7 @@ enum class RequestType {
     submit_profile_events = 6,
     submit_snapshot = 7,
     get_checkpoint_info = 8,
+    submit_log_messages = 9,
 
     // MUSCLE Peer Protocol
     get_next_message = 21
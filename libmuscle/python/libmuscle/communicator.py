@@ -6,8 +6,9 @@ from libmuscle.endpoint import Endpoint
 from libmuscle.mpp_message import ClosePort, MPPMessage
 from libmuscle.mpp_client import MPPClient
 from libmuscle.mcp.tcp_util import SocketClosed
-from libmuscle.mcp.transport_server import TransportServer
+from libmuscle.mcp.transport_server import ServerNotSupported, TransportServer
 from libmuscle.mcp.type_registry import transport_server_types
+from libmuscle.outbox import Outbox
 from libmuscle.peer_manager import PeerManager
 from libmuscle.post_office import PostOffice
 from libmuscle.port import Port
@@ -22,6 +23,14 @@ _logger = logging.getLogger(__name__)
 MessageObject = Any
 
 
+# Our endpoint and its Reference, the peer endpoints and their
+# References as objects and as strings, or None if the port is not
+# connected, and the outboxes for the peers if we send to them.
+_CachedEndpoints = Tuple[
+        Endpoint, Reference,
+        Optional[List[Tuple[Endpoint, Reference, str]]], List[Outbox]]
+
+
 class Message:
     """A message to be sent or received.
 
@@ -92,17 +101,18 @@ class Communicator:
         self._post_office = PostOffice()
         self._profiler = profiler
 
+        # created on demand, when our locations are first requested
         self._servers: List[TransportServer] = []
 
         # indexed by remote instance id
         self._clients: Dict[Reference, MPPClient] = {}
 
-        for server_type in transport_server_types:
-            server = server_type(self._post_office)
-            self._servers.append(server)
-
         self._ports: Dict[str, Port] = {}
 
+        # indexed by port name and slot
+        self._endpoint_cache: Dict[
+                Tuple[str, Optional[int]], _CachedEndpoints] = {}
+
     def get_locations(self) -> List[str]:
         """Returns a list of locations that we can be reached at.
 
@@ -110,9 +120,21 @@ class Communicator:
         the protocol name does not contain a colon and location may
         be an arbitrary string.
 
+        The servers that listen at these locations are started the
+        first time this is called.
+
         Returns:
             A list of strings describing network locations.
         """
+        if not self._servers:
+            for server_type in transport_server_types:
+                try:
+                    server = server_type(self._post_office)
+                    self._servers.append(server)
+                except ServerNotSupported as e:
+                    _logger.debug('Not using {}: {}'.format(
+                        server_type.__name__, e))
+
         return [server.get_location() for server in self._servers]
 
     def connect(self, conduits: List[Conduit],
@@ -137,6 +159,7 @@ class Communicator:
         self._peer_manager = PeerManager(
                 self._kernel, self._index, conduits, peer_dims,
                 peer_locations)
+        self._endpoint_cache = {}
 
         if self._declared_ports is not None:
             self._ports = self.__ports_from_declared()
@@ -184,7 +207,8 @@ class Communicator:
     def send_message(
             self, port_name: str, message: Message,
             slot: Optional[int] = None,
-            checkpoints_considered_until: float = float('-inf')) -> None:
+            checkpoints_considered_until: float = float('-inf'),
+            settings_overlay: Optional[Settings] = None) -> None:
         """Send a message and settings to the outside world.
 
         Sending is non-blocking, a copy of the message will be made
@@ -196,13 +220,13 @@ class Communicator:
             slot: The slot to send the message on, if any.
             checkpoints_considered_until: When we last checked if we
                 should save a snapshot (wallclock time).
+            settings_overlay: Settings to send if the message does not
+                have any.
         """
         if slot is None:
             _logger.debug('Sending message on {}'.format(port_name))
-            slot_list: List[int] = []
         else:
             _logger.debug('Sending message on {}[{}]'.format(port_name, slot))
-            slot_list = [slot]
             slot_length = self._ports[port_name].get_length()
             if slot_length <= slot:
                 raise RuntimeError(('Slot out of bounds. You are sending on'
@@ -210,40 +234,47 @@ class Communicator:
                                     ' {}, so that slot does not exist'
                                     ).format(slot, port_name, slot_length))
 
-        snd_endpoint = self.__get_endpoint(port_name, slot_list)
-        if not self._peer_manager.is_connected(snd_endpoint.port):
+        _, snd_ref, recv_endpoints, outboxes = self.__get_endpoints(
+                port_name, slot, True)
+        if recv_endpoints is None:
             # log sending on disconnected port
             return
 
+        if message.settings is not None:
+            settings_overlay = message.settings
+        if settings_overlay is None:
+            settings_overlay = Settings()
+
         port = self._ports[port_name]
         profile_event = ProfileEvent(
                 ProfileEventType.SEND, ProfileTimestamp(), None, port, None,
                 slot, port.get_num_messages(slot), None, message.timestamp)
 
-        recv_endpoints = self._peer_manager.get_peer_endpoints(
-                snd_endpoint.port, slot_list)
-
         port_length = None
         if port.is_resizable():
             port_length = port.get_length()
 
-        for recv_endpoint in recv_endpoints:
-            mpp_message = MPPMessage(snd_endpoint.ref(), recv_endpoint.ref(),
-                                     port_length,
-                                     message.timestamp, message.next_timestamp,
-                                     cast(Settings, message.settings),
-                                     port.get_num_messages(slot),
-                                     checkpoints_considered_until,
-                                     message.data)
-            encoded_message = mpp_message.encoded()
-            self._post_office.deposit(recv_endpoint.ref(), encoded_message)
+        # Multicast ports have more than one receiver, but the message is
+        # the same for each of them apart from the receiver, so we encode
+        # it only once.
+        recv_refs = [recv_ref for _, _, recv_ref in recv_endpoints]
+        mpp_message = MPPMessage(snd_ref, recv_endpoints[0][1],
+                                 port_length,
+                                 message.timestamp, message.next_timestamp,
+                                 settings_overlay,
+                                 port.get_num_messages(slot),
+                                 checkpoints_considered_until,
+                                 message.data)
+        encoded_messages = mpp_message.encoded_for(recv_refs)
+        for outbox, encoded_message in zip(outboxes, encoded_messages):
+            outbox.deposit(encoded_message)
 
         port.increment_num_messages(slot)
 
         profile_event.stop()
         if port.is_vector():
             profile_event.port_length = port.get_length()
-        profile_event.message_size = len(encoded_message)
+        profile_event.message_size = len(encoded_messages[-1])
         if not isinstance(message.data, ClosePort):
             self._profiler.record_event(profile_event)
 
@@ -278,15 +309,14 @@ class Communicator:
         """
         if slot is None:
             port_and_slot = port_name
-            slot_list: List[int] = []
         else:
             port_and_slot = f"{port_name}[{slot}]"
-            slot_list = [slot]
         _logger.debug('Waiting for message on {}'.format(port_and_slot))
 
-        recv_endpoint = self.__get_endpoint(port_name, slot_list)
+        _, recv_ref, snd_endpoints, _ = self.__get_endpoints(
+                port_name, slot, False)
 
-        if not self._peer_manager.is_connected(recv_endpoint.port):
+        if snd_endpoints is None:
             if default is None:
                 raise RuntimeError(('Tried to receive on port "{}", which is'
                                     ' disconnected, and no default value was'
@@ -312,11 +342,10 @@ class Communicator:
 
         # peer_manager already checks that there is at most one snd_endpoint
         # connected to the port we receive on
-        snd_endpoint = self._peer_manager.get_peer_endpoints(
-                recv_endpoint.port, slot_list)[0]
+        snd_endpoint = snd_endpoints[0][0]
         client = self.__get_client(snd_endpoint.instance())
         try:
-            mpp_message_bytes, profile = client.receive(recv_endpoint.ref())
+            mpp_message_bytes, profile = client.receive(recv_ref)
         except (ConnectionError, SocketClosed) as exc:
             raise RuntimeError(
                 "Error while receiving a message: connection with peer"
@@ -441,11 +470,6 @@ class Communicator:
             self._muscle_settings_in.get_message_counts()
         return port_message_counts
 
-    def __instance_id(self) -> Reference:
-        """Returns our complete instance id.
-        """
-        return self._kernel + self._index
-
     def __ports_from_declared(self) -> Dict[str, Port]:
         """Derives port definitions from supplied declaration.
         """
@@ -550,6 +574,52 @@ class Communicator:
 
         return self._clients[instance]
 
+    def __get_endpoints(self, port_name: str, slot: Optional[int],
+                        sending: bool) -> _CachedEndpoints:
+        """Determines the endpoints on our side and on the peer side.
+
+        These do not change once we are connected, so they are cached
+        to avoid rebuilding them for every message. The same goes for
+        the outboxes that messages to the peers go into.
+
+        Args:
+            port_name: Name of the port to send or receive on.
+            slot: Slot to send or receive on, if any.
+            sending: Whether we are sending on this port, and need
+                outboxes for the peers.
+
+        Returns:
+            Our endpoint and its Reference, a list of peer endpoints
+            with their References as objects and as strings or None if
+            the port is not connected, and a list of outboxes for the
+            peers, which is empty if we are receiving.
+        """
+        key = (port_name, slot)
+        endpoints = self._endpoint_cache.get(key)
+        if endpoints is None:
+            slot_list: List[int] = [] if slot is None else [slot]
+            our_endpoint = self.__get_endpoint(port_name, slot_list)
+
+            peer_endpoints: Optional[
+                    List[Tuple[Endpoint, Reference, str]]] = None
+            outboxes: List[Outbox] = list()
+            if self._peer_manager.is_connected(our_endpoint.port):
+                peer_endpoints = list()
+                for peer_endpoint in self._peer_manager.get_peer_endpoints(
+                        our_endpoint.port, slot_list):
+                    peer_ref = peer_endpoint.ref()
+                    peer_endpoints.append(
+                            (peer_endpoint, peer_ref, str(peer_ref)))
+                    if sending:
+                        outboxes.append(
+                                self._post_office.get_outbox(str(peer_ref)))
+
+            endpoints = (
+                    our_endpoint, our_endpoint.ref(), peer_endpoints, outboxes)
+            self._endpoint_cache[key] = endpoints
+
+        return endpoints
+
     def __get_endpoint(self, port_name: str, slot: List[int]) -> Endpoint:
         """Determines the endpoint on our side.
 
@@ -66,13 +66,7 @@ class Endpoint:
         Returns:
             A Reference to this Endpoint.
         """
-        ret = self.kernel
-        if self.index:
-            ret += self.index
-        ret += self.port
-        if self.slot:
-            ret += self.slot
-        return ret
+        return Reference([*self.kernel, *self.index, self.port, *self.slot])
 
     def __str__(self) -> str:
         """Convert to string.
@@ -88,7 +82,6 @@ class Endpoint:
     def instance(self) -> Reference:
         """Get a Reference to the instance this endpoint is on.
         """
-        ret = self.kernel
-        if self.index:
-            ret += self.index
-        return ret
+        if not self.index:
+            return self.kernel
+        return Reference([*self.kernel, *self.index])
@@ -1,9 +1,8 @@
-from copy import copy
 from enum import Flag, auto
 import logging
 import os
 import sys
-from typing import cast, Dict, List, Optional, Tuple, overload
+from typing import cast, Dict, List, NoReturn, Optional, Tuple, overload
 # TODO: import from typing module when dropping support for python 3.7
 from typing_extensions import Literal
 import warnings
@@ -431,14 +430,13 @@ class Instance:
             message: The message to be sent.
             slot: The slot to send the message on, if any.
         """
-        self.__check_port(port_name)
-        if message.settings is None:
-            message = copy(message)
-            message.settings = self._settings_manager.overlay
+        if not self._communicator.port_exists(port_name):
+            self.__port_not_found(port_name)
 
         self._communicator.send_message(
                 port_name, message, slot,
-                self._trigger_manager.checkpoints_considered_until())
+                self._trigger_manager.checkpoints_considered_until(),
+                self._settings_manager.overlay)
 
     def receive(self, port_name: str, slot: Optional[int] = None,
                 default: Optional[Message] = None
@@ -711,6 +709,9 @@ class Instance:
 
         # This is the last thing we'll profile, so flush messages
         self._profiler.shutdown()
+
+        # Send any pending log messages, and send any further ones directly
+        self._mmp_handler.close()
         self.__manager.deregister_instance()
 
         # Remove handler, the manager may be gone at this point so we
@@ -879,9 +880,11 @@ class Instance:
         This implements receive and receive_with_settings, see the
         description of those.
         """
-        self.__check_port(port_name)
+        try:
+            port = self._communicator.get_port(port_name)
+        except KeyError:
+            self.__port_not_found(port_name)
 
-        port = self._communicator.get_port(port_name)
         if port.operator == Operator.F_INIT:
             if (port_name, slot) in self._f_init_cache:
                 msg = self._f_init_cache[(port_name, slot)]
@@ -987,13 +990,12 @@ class Instance:
                     result.append(Port(Identifier(name), operator))
         return result
 
-    def __check_port(self, port_name: str) -> None:
-        if not self._communicator.port_exists(port_name):
-            err_msg = (('Port "{}" does not exist on "{}". Please check'
-                        ' the name and the list of ports you gave for'
-                        ' this component.').format(port_name, self._name))
-            self.__shutdown(err_msg)
-            raise RuntimeError(err_msg)
+    def __port_not_found(self, port_name: str) -> NoReturn:
+        err_msg = (('Port "{}" does not exist on "{}". Please check'
+                    ' the name and the list of ports you gave for'
+                    ' this component.').format(port_name, self._name))
+        self.__shutdown(err_msg)
+        raise RuntimeError(err_msg)
 
     def _have_f_init_connections(self) -> bool:
         """Checks whether we have connected F_INIT ports.
@@ -1169,7 +1171,14 @@ class Instance:
         """
         if overlay is None:
             return
-        if self._settings_manager.overlay != overlay:
+
+        # Usually both overlays are empty, and comparing Settings
+        # copies both of them, so check for that first.
+        current = self._settings_manager.overlay
+        if len(current) == 0 and len(overlay) == 0:
+            return
+
+        if current != overlay:
             err_msg = (('Unexpectedly received data from a'
                         ' parallel universe on port "{}". My'
                         ' settings are "{}" and I received'
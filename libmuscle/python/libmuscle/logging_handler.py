@@ -1,4 +1,6 @@
 import logging
+from threading import Condition, Lock, Thread
+from typing import List
 
 from libmuscle.logging import LogLevel, LogMessage, Timestamp
 from libmuscle.mmp_client import MMPClient
@@ -10,6 +12,11 @@ class MuscleManagerHandler(logging.Handler):
     A MuscleManagerHandler is a standard Python log handler, which can
     be attached to a logger, and forwards log messages to the Muscle
     Manager for central logging.
+
+    Messages are sent by a background thread, which sends all messages
+    that have accumulated since it last sent in a single request. Call
+    flush() to make sure that everything has been sent, and close()
+    when done. After closing, messages are sent immediately.
     """
     def __init__(self, instance_id: str, level: int, mmp_client: MMPClient
                  ) -> None:
@@ -24,8 +31,71 @@ class MuscleManagerHandler(logging.Handler):
         self._instance_id = instance_id
         self._manager = mmp_client
 
+        # Protects _messages and _done
+        self._mutex = Lock()
+        self._messages: List[LogMessage] = []
+        self._messages_cv = Condition(self._mutex)
+        self._done = False
+
+        # Held while sending, so that flush() can wait for the thread
+        self._send_mutex = Lock()
+
+        self._thread = Thread(target=self._communicate, daemon=True)
+        self._thread.start()
+
     def emit(self, record: logging.LogRecord) -> None:
         message = LogMessage(self._instance_id, Timestamp(record.created),
                              LogLevel.from_python_level(record.levelno),
                              self.format(record))
-        self._manager.submit_log_message(message)
+        with self._mutex:
+            if not self._done:
+                self._messages.append(message)
+                self._messages_cv.notify()
+                return
+
+        with self._send_mutex:
+            self._send()
+            self._manager.submit_log_message(message)
+
+    def flush(self) -> None:
+        """Sends any pending messages to the manager.
+        """
+        with self._send_mutex:
+            self._send()
+
+    def close(self) -> None:
+        """Stops the background thread and sends any pending messages.
+        """
+        with self._mutex:
+            self._done = True
+            self._messages_cv.notify_all()
+
+        if self._thread.is_alive():
+            self._thread.join()
+        self.flush()
+        super().close()
+
+    def _communicate(self) -> None:
+        """Background thread that sends messages to the manager.
+        """
+        while True:
+            with self._mutex:
+                while not self._messages and not self._done:
+                    self._messages_cv.wait()
+                if self._done:
+                    return
+
+            with self._send_mutex:
+                self._send()
+
+    def _send(self) -> None:
+        """Sends and removes all pending messages.
+
+        Make sure to lock self._send_mutex before calling this.
+        """
+        with self._mutex:
+            messages = self._messages
+            self._messages = []
+
+        if messages:
+            self._manager.submit_log_messages(messages)
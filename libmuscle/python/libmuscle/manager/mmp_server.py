@@ -118,6 +118,8 @@ class MMPRequestHandler(RequestHandler):
             response = self._get_settings(*req_args)
         elif req_type == RequestType.SUBMIT_LOG_MESSAGE.value:
             response = self._submit_log_message(*req_args)
+        elif req_type == RequestType.SUBMIT_LOG_MESSAGES.value:
+            response = self._submit_log_messages(*req_args)
         elif req_type == RequestType.SUBMIT_PROFILE_EVENTS.value:
             response = self._submit_profile_events(*req_args)
         elif req_type == RequestType.SUBMIT_SNAPSHOT.value:
@@ -287,6 +289,24 @@ class MMPRequestHandler(RequestHandler):
                 instance_id, Timestamp(timestamp), LogLevel(level), text)
         return [ResponseType.SUCCESS.value]
 
+    def _submit_log_messages(self, messages: List[List[Any]]) -> Any:
+        """Handle a submit log messages request.
+
+        Args:
+            messages: A list of log messages, each a list containing
+                    the sending instance, the time since epoch of the
+                    logged event, the log level and the message text.
+
+        Returns:
+            A list containing the following values on success:
+
+            status (ResponseType): SUCCESS
+        """
+        for instance_id, timestamp, level, text in messages:
+            self._logger.log_message(
+                    instance_id, Timestamp(timestamp), LogLevel(level), text)
+        return [ResponseType.SUCCESS.value]
+
     def _submit_profile_events(
             self, instance_id: str, events: List[List[Any]]) -> Any:
         """Handle a submit profile events request.
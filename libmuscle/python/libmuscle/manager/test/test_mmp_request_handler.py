@@ -41,6 +41,29 @@ def test_log_message(mmp_request_handler, caplog):
     assert caplog.records[0].message == 'Testing log message'
 
 
+def test_log_messages(mmp_request_handler, caplog):
+    request = [
+            RequestType.SUBMIT_LOG_MESSAGES.value, [
+                ['test_instance_id', 0.0, LogLevel.WARNING.value,
+                 'Testing log message'],
+                ['test_instance_id', 1.0, LogLevel.ERROR.value,
+                 'Testing another log message']]]
+    encoded_request = msgpack.packb(request, use_bin_type=True)
+
+    result = mmp_request_handler.handle_request(encoded_request)
+
+    decoded_result = msgpack.unpackb(result, raw=False)
+
+    assert decoded_result == [ResponseType.SUCCESS.value]
+
+    assert len(caplog.records) == 2
+    assert caplog.records[0].name == 'test_instance_id'
+    assert caplog.records[0].levelname == 'WARNING'
+    assert caplog.records[0].message == 'Testing log message'
+    assert caplog.records[1].levelname == 'ERROR'
+    assert caplog.records[1].message == 'Testing another log message'
+
+
 def test_get_settings(mmp_configuration, mmp_request_handler):
     request = [RequestType.GET_SETTINGS.value]
     encoded_request = msgpack.packb(request, use_bin_type=True)
@@ -1,7 +1,7 @@
 from libmuscle.manager.topology_store import TopologyStore
 
 import pytest
-from ymmsl import Configuration, Reference
+from ymmsl import Configuration, Reference, load
 
 
 def test_create_topology_store(topology_store) -> None:
@@ -32,6 +32,28 @@ def test_get_conduits(topology_store2) -> None:
     assert conduits[3].receiver == 'macro.in'
 
 
+def test_get_conduits_self_loop() -> None:
+    config = load(
+            'ymmsl_version: v0.1\n'
+            'model:\n'
+            '  name: test_model\n'
+            '  components:\n'
+            '    macro: macro_implementation\n'
+            '  conduits:\n'
+            '    macro.out: macro.in\n')
+    topology_store = TopologyStore(config)
+
+    conduits = topology_store.get_conduits(Reference('macro'))
+    assert len(conduits) == 1
+    assert conduits[0].sender == 'macro.out'
+    assert conduits[0].receiver == 'macro.in'
+
+    assert topology_store.get_conduits(Reference('micro')) == []
+
+    peer_dims = topology_store.get_peer_dimensions(Reference('macro'))
+    assert peer_dims == {Reference('macro'): []}
+
+
 def test_get_peer_dimensions(topology_store) -> None:
     macro_peer_dims = topology_store.get_peer_dimensions(Reference('macro'))
 
@@ -31,6 +31,19 @@ class TopologyStore:
                 k.name: k.multiplicity
                 for k in config.model.components}
 
+        # Conduits and peers of each kernel, in conduit order
+        self._kernel_conduits: Dict[Reference, List[Conduit]] = dict()
+        self._kernel_peers: Dict[Reference, Dict[Reference, None]] = dict()
+        for conduit in self.conduits:
+            snd = conduit.sending_component()
+            recv = conduit.receiving_component()
+            self._kernel_conduits.setdefault(snd, list()).append(conduit)
+            self._kernel_peers.setdefault(snd, dict())[recv] = None
+            if recv != snd:
+                # A conduit from a kernel to itself is listed only once
+                self._kernel_conduits.setdefault(recv, list()).append(conduit)
+                self._kernel_peers.setdefault(recv, dict())[snd] = None
+
     def has_kernel(self, kernel: Reference) -> bool:
         """Returns True iff the given kernel is in the model.
 
@@ -48,13 +61,7 @@ class TopologyStore:
         Returns:
             All conduits that this kernel is a sender or receiver of.
         """
-        ret = list()
-        for conduit in self.conduits:
-            if conduit.sending_component() == kernel_name:
-                ret.append(conduit)
-            if conduit.receiving_component() == kernel_name:
-                ret.append(conduit)
-        return ret
+        return list(self._kernel_conduits.get(kernel_name, ()))
 
     def get_peer_dimensions(self, kernel_name: Reference
                             ) -> Dict[Reference, List[int]]:
@@ -69,15 +76,9 @@ class TopologyStore:
         Returns:
             A dict of peer kernels and their dimensions.
         """
-        ret = dict()
-        for conduit in self.conduits:
-            if conduit.sending_component() == kernel_name:
-                recv = conduit.receiving_component()
-                ret[recv] = self.kernel_dimensions[recv]
-            if conduit.receiving_component() == kernel_name:
-                snd = conduit.sending_component()
-                ret[snd] = self.kernel_dimensions[snd]
-        return ret
+        return {
+                peer: self.kernel_dimensions[peer]
+                for peer in self._kernel_peers.get(kernel_name, ())}
 
     def get_peer_instances(self, instance: Reference) -> List[Reference]:
         """Generates the names of all peer instances of an instance.
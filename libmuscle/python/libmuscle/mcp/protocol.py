@@ -22,6 +22,7 @@ class RequestType(Enum):
     SUBMIT_PROFILE_EVENTS = 6
     SUBMIT_SNAPSHOT = 7
     GET_CHECKPOINT_INFO = 8
+    SUBMIT_LOG_MESSAGES = 9
 
     # MUSCLE Peer Protocol
     GET_NEXT_MESSAGE = 21
@@ -3,7 +3,7 @@ import socket
 from typing import Optional, Tuple
 
 from libmuscle.mcp.transport_client import ProfileData, TransportClient
-from libmuscle.mcp.tcp_util import recv_all, recv_int64, send_int64
+from libmuscle.mcp.tcp_util import recv_all, recv_int64, send_frame
 from libmuscle.profiling import ProfileTimestamp
 
 
@@ -63,8 +63,7 @@ class TcpTransportClient(TransportClient):
             The received response
         """
         start_wait = ProfileTimestamp()
-        send_int64(self._socket, len(request))
-        self._socket.sendall(request)
+        send_frame(self._socket, request)
 
         length = recv_int64(self._socket)
         start_transfer = ProfileTimestamp()
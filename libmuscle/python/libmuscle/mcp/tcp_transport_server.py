@@ -7,7 +7,7 @@ from typing_extensions import Type
 import netifaces
 
 from libmuscle.mcp.transport_server import RequestHandler, TransportServer
-from libmuscle.mcp.tcp_util import (recv_all, recv_int64, send_int64,
+from libmuscle.mcp.tcp_util import (recv_all, recv_int64, send_frame,
                                     SocketClosed)
 
 
@@ -41,8 +41,7 @@ class TcpHandler(ss.BaseRequestHandler):
             server = cast(TcpTransportServerImpl, self.server).transport_server
             response = server._handler.handle_request(request)
 
-            send_int64(self.request, len(response))
-            self.request.sendall(response)
+            send_frame(self.request, response)
             request = self.receive_request()
 
     def receive_request(self) -> Optional[bytes]:
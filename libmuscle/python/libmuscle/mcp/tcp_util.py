@@ -62,3 +62,35 @@ def recv_int64(socket: SocketType) -> int:
     """
     buf = recv_all(socket, 8)
     return int.from_bytes(buf, 'little')
+
+
+def send_frame(socket: SocketType, data: bytes) -> None:
+    """Sends a chunk of bytes, preceded by its length.
+
+    This sends the same bytes as a call to :func:`send_int64` with the
+    length followed by a send of the data, but does it in a single
+    system call where possible without copying the data. This avoids
+    sending the length in a separate small packet.
+
+    Args:
+        socket: The socket to send on.
+        data: The data to send.
+
+    Raises:
+        OSError: If there was an error sending the data.
+    """
+    header = len(data).to_bytes(8, byteorder='little')
+    if not hasattr(socket, 'sendmsg'):
+        socket.sendall(header)
+        socket.sendall(data)
+        return
+
+    buffers = [memoryview(header), memoryview(data)]
+    while buffers:
+        sent = socket.sendmsg(buffers)
+        # Remove what was sent, including any empty buffers
+        while buffers and sent >= len(buffers[0]):
+            sent -= len(buffers[0])
+            buffers.pop(0)
+        if sent > 0:
+            buffers[0] = buffers[0][sent:]
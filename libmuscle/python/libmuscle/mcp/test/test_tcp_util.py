@@ -0,0 +1,27 @@
+import socket
+from threading import Thread
+
+from libmuscle.mcp.tcp_util import recv_all, recv_int64, send_frame
+
+
+def test_send_frame():
+    frames = [b'test data', b'', b'x' * 10000000]
+    received = list()
+
+    sender, receiver = socket.socketpair()
+
+    def receive() -> None:
+        for _ in frames:
+            length = recv_int64(receiver)
+            received.append(recv_all(receiver, length))
+
+    receiver_thread = Thread(target=receive)
+    receiver_thread.start()
+    try:
+        for frame in frames:
+            send_frame(sender, frame)
+        receiver_thread.join()
+        assert received == frames
+    finally:
+        sender.close()
+        receiver.close()
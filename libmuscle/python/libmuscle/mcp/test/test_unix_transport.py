@@ -0,0 +1,61 @@
+import os
+from pathlib import Path
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from libmuscle.mcp.unix_transport_client import UnixTransportClient
+from libmuscle.mcp.unix_transport_server import UnixTransportServer
+
+
+def test_unix_transport():
+    request = b'request'
+    response = b'response'
+
+    def handle_request(request: bytes) -> bytes:
+        assert request == b'request'
+        return response
+
+    handler = MagicMock()
+    handler.handle_request = handle_request
+
+    # create server
+    server = UnixTransportServer(handler)
+
+    # create client
+    server_location = server.get_location()
+    assert server_location.startswith('unix:')
+    assert UnixTransportClient.can_connect_to(server_location)
+    client = UnixTransportClient(server_location)
+
+    response2, _ = client.call(request)
+    assert response == response2
+
+    client.close()
+    server.close()
+    assert not server._dir.exists()
+
+
+def test_unix_transport_cleanup_at_exit():
+    # server is never closed, its socket should be removed anyway
+    script = (
+            'from unittest.mock import MagicMock\n'
+            'from libmuscle.mcp.unix_transport_server import'
+            ' UnixTransportServer\n'
+            'server = UnixTransportServer(MagicMock())\n'
+            'print(server._dir)\n')
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+            [sys.executable, '-c', script], env=env, stdout=subprocess.PIPE,
+            check=True, universal_newlines=True)
+    server_dir = Path(result.stdout.strip())
+    assert server_dir.name.startswith('muscle3_')
+    assert not server_dir.exists()
+
+
+def test_unix_transport_no_server():
+    assert not UnixTransportClient.can_connect_to('tcp:localhost:1234')
+    with pytest.raises(RuntimeError):
+        UnixTransportClient('unix:/nonexistent/muscle3/mpp.sock')
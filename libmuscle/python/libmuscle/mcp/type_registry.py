@@ -1,9 +1,11 @@
 from libmuscle.mcp.tcp_transport_client import TcpTransportClient
 from libmuscle.mcp.tcp_transport_server import TcpTransportServer
+from libmuscle.mcp.unix_transport_client import UnixTransportClient
+from libmuscle.mcp.unix_transport_server import UnixTransportServer
 
 
 # These must be in order of preference, i.e. most efficient first
-transport_client_types = [TcpTransportClient]
+transport_client_types = [UnixTransportClient, TcpTransportClient]
 
 
-transport_server_types = [TcpTransportServer]
+transport_server_types = [TcpTransportServer, UnixTransportServer]
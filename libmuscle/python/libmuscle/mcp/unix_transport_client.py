@@ -0,0 +1,87 @@
+from errno import ENOTCONN
+import socket
+from typing import Tuple
+
+from libmuscle.mcp.transport_client import ProfileData, TransportClient
+from libmuscle.mcp.tcp_util import recv_all, recv_int64, send_frame
+from libmuscle.profiling import ProfileTimestamp
+
+
+class UnixTransportClient(TransportClient):
+    """A client that connects to a UnixTransport server.
+
+    Unix domain sockets only work within a single machine. If the
+    server is elsewhere, then creating the client will fail, and
+    another transport should be used.
+    """
+    @staticmethod
+    def can_connect_to(location: str) -> bool:
+        """Whether this client class can connect to the given location.
+
+        Args:
+            location: The location to potentially connect to.
+
+        Returns:
+            True iff this class can connect to this location.
+        """
+        return location.startswith('unix:') and hasattr(socket, 'AF_UNIX')
+
+    def __init__(self, location: str) -> None:
+        """Create a UnixTransportClient for a given location.
+
+        The client will connect to this location and be able to request
+        messages from any instance and port represented by it.
+
+        Args:
+            location: A location string for the peer.
+
+        Raises:
+            RuntimeError: If the server could not be reached.
+        """
+        path = location[5:]
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(path)
+        except OSError:
+            sock.close()
+            raise RuntimeError('Could not connect to the server at location'
+                               ' {}'.format(location))
+
+        self._socket = sock
+
+    def call(self, request: bytes) -> Tuple[bytes, ProfileData]:
+        """Send a request to the server and receive the response.
+
+        This is a blocking call.
+
+        Args:
+            request: The request to send
+
+        Returns:
+            The received response
+        """
+        start_wait = ProfileTimestamp()
+        send_frame(self._socket, request)
+
+        length = recv_int64(self._socket)
+        start_transfer = ProfileTimestamp()
+
+        response = recv_all(self._socket, length)
+        stop_transfer = ProfileTimestamp()
+        return response, (start_wait, start_transfer, stop_transfer)
+
+    def close(self) -> None:
+        """Closes this client.
+
+        This closes any connections this client has and/or performs
+        other shutdown activities.
+        """
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+            self._socket.close()
+        except OSError as e:
+            # This can happen if the peer has shut down already when we
+            # close our connection to it, which is fine.
+            if e.errno != ENOTCONN:
+                raise
@@ -0,0 +1,79 @@
+from pathlib import Path
+import shutil
+import socket
+import socketserver as ss
+import tempfile
+import threading
+import weakref
+
+from libmuscle.mcp.transport_server import (
+        RequestHandler, ServerNotSupported, TransportServer)
+from libmuscle.mcp.tcp_transport_server import TcpHandler
+
+
+class UnixTransportServerImpl(ss.ThreadingMixIn, ss.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, transport_server: 'UnixTransportServer'
+                 ) -> None:
+        super().__init__(path, TcpHandler)
+        self.transport_server = transport_server
+
+
+class UnixTransportServer(TransportServer):
+    """A TransportServer that uses Unix domain sockets to communicate.
+
+    This only works for clients on the same machine, but avoids the
+    overhead of the TCP/IP stack for them. The protocol is the same as
+    for TCP, so the TCP request handler is reused.
+    """
+    def __init__(self, handler: RequestHandler) -> None:
+        """Create a UnixTransportServer.
+
+        Args:
+            handler: A RequestHandler to handle requests
+
+        Raises:
+            ServerNotSupported: If Unix domain sockets are not
+                available, or we could not create one.
+        """
+        super().__init__(handler)
+
+        if not hasattr(socket, 'AF_UNIX'):
+            raise ServerNotSupported('Unix domain sockets are not available')
+
+        self._dir = Path(tempfile.mkdtemp(prefix='muscle3_'))
+        self._path = self._dir / 'mpp.sock'
+        try:
+            self._server = UnixTransportServerImpl(str(self._path), self)
+        except OSError as e:
+            self._dir.rmdir()
+            raise ServerNotSupported(
+                    'Could not create a Unix domain socket: {}'.format(e))
+
+        # Remove the socket and its directory at exit if we're not closed
+        self._remove_dir = weakref.finalize(
+                self, shutil.rmtree, str(self._dir), ignore_errors=True)
+
+        self._server_thread = threading.Thread(
+                target=self._server.serve_forever, args=(0.1,), daemon=True)
+        self._server_thread.start()
+
+    def get_location(self) -> str:
+        """Returns the location this server listens on.
+
+        Returns:
+            A string containing the location.
+        """
+        return 'unix:{}'.format(self._path)
+
+    def close(self) -> None:
+        """Closes this server.
+
+        Stops the server listening, waits for existing clients to
+        disconnect, then frees any other resources.
+        """
+        self._server.shutdown()
+        self._server_thread.join()
+        self._server.server_close()
+        self._remove_dir()
@@ -1,6 +1,7 @@
 import dataclasses
 from pathlib import Path
 from random import uniform
+from threading import Lock
 from time import perf_counter, sleep
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -116,6 +117,10 @@ class MMPClient():
         self._instance_id = instance_id
         self._transport_client = TcpTransportClient(location)
 
+        # Protects the connection, which is shared by the main thread
+        # and the profiling and logging threads
+        self._mutex = Lock()
+
     def close(self) -> None:
         """Close the connection
 
@@ -136,6 +141,18 @@ class MMPClient():
                 message.level.value, message.text]
         self._call_manager(request)
 
+    def submit_log_messages(self, messages: Iterable[LogMessage]) -> None:
+        """Send several log messages to the manager at once.
+
+        Args:
+            messages: The messages to send.
+        """
+        request = [
+                RequestType.SUBMIT_LOG_MESSAGES.value,
+                [[m.instance_id, m.timestamp.seconds, m.level.value, m.text]
+                 for m in messages]]
+        self._call_manager(request)
+
     def submit_profile_events(self, events: Iterable[ProfileEvent]) -> None:
         """Sends profiling events to the manager.
 
@@ -281,5 +298,6 @@ class MMPClient():
             The decoded response
         """
         encoded_request = msgpack.packb(request, use_bin_type=True)
-        response, _ = self._transport_client.call(encoded_request)
+        with self._mutex:
+            response, _ = self._transport_client.call(encoded_request)
         return msgpack.unpackb(response, raw=False)
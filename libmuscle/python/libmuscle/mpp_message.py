@@ -1,5 +1,6 @@
 from enum import IntEnum
-from typing import Any, cast, Optional
+import threading
+from typing import Any, List, Optional, Union, cast
 
 import msgpack
 import numpy as np
@@ -33,6 +34,13 @@ _grid_types = {
         ExtTypeId.GRID_BOOL}
 
 
+_EMPTY_MAP = msgpack.packb({})
+
+
+# An empty Settings object, encoded. Most settings overlays are empty.
+_EMPTY_SETTINGS = msgpack.ExtType(ExtTypeId.SETTINGS, _EMPTY_MAP)
+
+
 class ClosePort:
     """Sentinel value to send when closing a port.
 
@@ -72,7 +80,9 @@ def _encode_grid(grid: Grid) -> msgpack.ExtType:
     if array_type not in ext_type_map:
         raise RuntimeError('Unsupported array data type')
 
-    buf = array.tobytes(order='A')
+    # For contiguous arrays, this is a view, so that the data gets copied
+    # straight into the output rather than into a temporary bytes first.
+    buf = array.ravel(order='A').data
 
     # array_type is redundant, but useful metadata.
     grid_dict = {
@@ -119,8 +129,9 @@ def _data_encoder(obj: Any) -> Any:
     if isinstance(obj, ClosePort):
         return msgpack.ExtType(ExtTypeId.CLOSE_PORT, bytes())
     elif isinstance(obj, Settings):
-        packed_data = msgpack.packb(obj.as_ordered_dict(),
-                                    use_bin_type=True)
+        if len(obj) == 0:
+            return _EMPTY_SETTINGS
+        packed_data = msgpack.packb(obj.as_ordered_dict(), use_bin_type=True)
         return msgpack.ExtType(ExtTypeId.SETTINGS, packed_data)
     elif isinstance(obj, np.ndarray):
         return _encode_grid(Grid(obj))
@@ -129,10 +140,57 @@ def _data_encoder(obj: Any) -> Any:
     return obj
 
 
+# Largest packed object after which we still keep a Packer's buffer
+_MAX_KEPT_BUFFER_SIZE = 1024 * 1024
+
+
+class _Packers(threading.local):
+    """Reusable MessagePack packer for messages.
+
+    Creating a Packer for every message is relatively expensive, so we
+    keep one around. Packers are not thread-safe, so each thread gets
+    its own.
+
+    A Packer's buffer grows to fit the largest object it has packed and
+    never shrinks, so after packing something large the Packer is
+    replaced, rather than keeping that memory for the life of the
+    thread.
+
+    Attributes:
+        message: Packer for messages, including user data.
+    """
+    def __init__(self) -> None:
+        self._new_message_packer()
+
+    def pack(self, obj: Any) -> bytes:
+        """Pack an object using the message packer.
+
+        Args:
+            obj: The object to pack.
+
+        Returns:
+            The packed object.
+        """
+        packed = cast(bytes, self.message.pack(obj))
+        if len(packed) > _MAX_KEPT_BUFFER_SIZE:
+            self._new_message_packer()
+        return packed
+
+    def _new_message_packer(self) -> None:
+        self.message = msgpack.Packer(
+                default=_data_encoder, use_bin_type=True)
+
+
+_packers = _Packers()
+
+
 def _ext_decoder(code: int, data: bytes) -> msgpack.ExtType:
     if code == ExtTypeId.CLOSE_PORT:
         return ClosePort()
     elif code == ExtTypeId.SETTINGS:
+        if data == _EMPTY_MAP:
+            # Most messages have an empty overlay, skip unpacking
+            return Settings()
         plain_dict = msgpack.unpackb(data, raw=False)
         return Settings(plain_dict)
     elif code in _grid_types:
@@ -147,7 +205,8 @@ class MPPMessage:
     they can be routed by a MUSCLE Transport Overlay when we get to
     multi-site running in the future.
     """
-    def __init__(self, sender: Reference, receiver: Reference,
+    def __init__(self, sender: Union[Reference, str],
+                 receiver: Union[Reference, str],
                  port_length: Optional[int],
                  timestamp: float, next_timestamp: Optional[float],
                  settings_overlay: Settings, message_number: int,
@@ -156,7 +215,9 @@ class MPPMessage:
         """Create an MPPMessage.
 
         Senders and receivers are refered to by a Reference, which
-        contains Instance[InstanceNumber].Port[Slot].
+        contains Instance[InstanceNumber].Port[Slot]. They may also be
+        given as strings, in which case they are only converted to a
+        Reference when accessed.
 
         The port_length field is only used if two vector ports are
         connected together. In that case the number of slots is not
@@ -179,8 +240,8 @@ class MPPMessage:
         if next_timestamp is not None:
             next_timestamp = float(next_timestamp)
 
-        self.sender = sender
-        self.receiver = receiver
+        self._sender = sender
+        self._receiver = receiver
         self.port_length = port_length
         self.timestamp = timestamp
         self.next_timestamp = next_timestamp
@@ -192,6 +253,22 @@ class MPPMessage:
         else:
             self.data = data
 
+    @property
+    def sender(self) -> Reference:
+        """The sending endpoint.
+        """
+        if not isinstance(self._sender, Reference):
+            self._sender = Reference(self._sender)
+        return self._sender
+
+    @property
+    def receiver(self) -> Reference:
+        """The receiving endpoint.
+        """
+        if not isinstance(self._receiver, Reference):
+            self._receiver = Reference(self._receiver)
+        return self._receiver
+
     @staticmethod
     def from_bytes(message: bytes) -> 'MPPMessage':
         """Create an MPP Message from an encoded buffer.
@@ -201,8 +278,9 @@ class MPPMessage:
         """
         message_dict = msgpack.unpackb(
                 message, ext_hook=_ext_decoder, raw=False)
-        sender = Reference(message_dict["sender"])
-        receiver = Reference(message_dict["receiver"])
+        # These are not needed when receiving, so don't parse them here
+        sender = message_dict["sender"]
+        receiver = message_dict["receiver"]
         port_length = message_dict["port_length"]
         timestamp = message_dict["timestamp"]
         next_timestamp = message_dict["next_timestamp"]
@@ -218,17 +296,58 @@ class MPPMessage:
     def encoded(self) -> bytes:
         """Encode the message and return as a bytes buffer.
         """
-        message_dict = {
-                'sender': str(self.sender),
-                'receiver': str(self.receiver),
-                'port_length': self.port_length,
-                'timestamp': self.timestamp,
-                'next_timestamp': self.next_timestamp,
-                'settings_overlay': self.settings_overlay,
-                'message_number': self.message_number,
-                'saved_until': self.saved_until,
-                'data': self.data
-                }
-
-        return cast(bytes, msgpack.packb(
-            message_dict, default=_data_encoder, use_bin_type=True))
+        return self.encoded_for([str(self._receiver)])[0]
+
+    def encoded_for(self, receivers: List[str]) -> List[bytes]:
+        """Encode the message for each of the given receivers.
+
+        This returns one encoded message for each receiver, each of
+        which is identical to this message except for the receiver. The
+        receiver attribute of this message is not used.
+
+        The rest of the message, including the data, is encoded only
+        once and shared, so that sending the same message to many
+        receivers does not require encoding it many times.
+
+        Args:
+            receivers: The receivers to encode the message for.
+
+        Returns:
+            A list of encoded messages, one for each receiver.
+        """
+        if len(receivers) == 1:
+            # Packing in one go avoids copying the data again to join parts
+            message_dict = {
+                    'sender': str(self._sender),
+                    'receiver': receivers[0],
+                    'port_length': self.port_length,
+                    'timestamp': self.timestamp,
+                    'next_timestamp': self.next_timestamp,
+                    'settings_overlay': self.settings_overlay,
+                    'message_number': self.message_number,
+                    'saved_until': self.saved_until,
+                    'data': self.data
+                    }
+            return [_packers.pack(message_dict)]
+
+        packer = _packers.message
+
+        # This produces exactly what packing a dict would, but in parts
+        head = packer.pack_map_header(9) + packer.pack('sender') + packer.pack(
+                str(self._sender)) + packer.pack('receiver')
+        packed_receivers = [packer.pack(receiver) for receiver in receivers]
+
+        # Packing the data may replace the packer, so do it last
+        parts = [
+                packer.pack('port_length'), packer.pack(self.port_length),
+                packer.pack('timestamp'), packer.pack(self.timestamp),
+                packer.pack('next_timestamp'), packer.pack(self.next_timestamp),
+                packer.pack('settings_overlay'),
+                packer.pack(self.settings_overlay),
+                packer.pack('message_number'), packer.pack(self.message_number),
+                packer.pack('saved_until'), packer.pack(self.saved_until),
+                packer.pack('data'), _packers.pack(self.data)]
+
+        return [
+                b''.join([head, packed_receiver] + parts)
+                for packed_receiver in packed_receivers]
@@ -1,4 +1,4 @@
-from queue import Queue
+from queue import SimpleQueue
 
 
 class Outbox:
@@ -10,7 +10,9 @@ class Outbox:
     def __init__(self) -> None:
         """Create an empty Outbox.
         """
-        self.__queue: Queue[bytes] = Queue()
+        # SimpleQueue is implemented in C and is much cheaper than Queue,
+        # and we don't need Queue's task tracking or size limits.
+        self.__queue: SimpleQueue[bytes] = SimpleQueue()
 
     def is_empty(self) -> bool:
         """Returns True iff the outbox is empty.
@@ -1,4 +1,4 @@
-from typing import cast, Dict, List
+from typing import cast, Dict, List, Tuple
 
 from ymmsl import Conduit, Identifier, Reference
 
@@ -37,11 +37,11 @@ class PeerManager:
         self.__peers: Dict[Reference, List[Reference]] = {}
 
         for conduit in conduits:
-            if str(conduit.sending_component()) == str(kernel):
+            if conduit.sending_component() == kernel:
                 # we send on the port this conduit attaches to
                 self.__peers.setdefault(
                         conduit.sender, []).append(conduit.receiver)
-            if str(conduit.receiving_component()) == str(kernel):
+            if conduit.receiving_component() == kernel:
                 # we receive on the port this conduit attaches to
                 if conduit.receiver in self.__peers:
                     raise RuntimeError(('Receiving port "{}" is connected by'
@@ -53,14 +53,29 @@ class PeerManager:
         self.__peer_dims = peer_dims    # indexed by kernel id
         self.__peer_locations = peer_locations  # indexed by instance id
 
+        # peer port ids, indexed by local port id, so that lookups don't
+        # need to build a kernel.port Reference
+        self.__port_peers: Dict[Identifier, List[Reference]] = {
+                cast(Identifier, full_port[-1]): peers
+                for full_port, peers in self.__peers.items()}
+
+        # peer kernel, peer port and number of peer kernel dimensions,
+        # for each peer port, indexed by local port id
+        self.__peer_splits: Dict[
+                Identifier, List[Tuple[Reference, Identifier, int]]] = {
+                    port: [
+                        (peer[:-1], cast(Identifier, peer[-1]),
+                         len(peer_dims[peer[:-1]]))
+                        for peer in peers]
+                    for port, peers in self.__port_peers.items()}
+
     def is_connected(self, port: Identifier) -> bool:
         """Determine whether the given port is connected.
 
         Args:
             port: The port to check.
         """
-        recv_port_full = self.__kernel + port
-        return recv_port_full in self.__peers
+        return port in self.__port_peers
 
     def get_peer_ports(self, port: Identifier) -> List[Reference]:
         """Get a reference for the peer ports.
@@ -68,7 +83,7 @@ class PeerManager:
         Args:
             port: Name of the port on this side.
         """
-        return self.__peers[self.__kernel + port]
+        return self.__port_peers[port]
 
     def get_peer_dims(self, peer_kernel: Reference) -> List[int]:
         """Get the dimensions of a peer kernel.
@@ -100,17 +115,13 @@ class PeerManager:
         Returns:
             The peer endpoints.
         """
-        peers = self.__peers[self.__kernel + port]
+        peers = self.__peer_splits[port]
         endpoints = []
 
-        for peer in peers:
-            peer_kernel = peer[:-1]
-            peer_port = cast(Identifier, peer[-1])
-
-            total_index = self.__index + slot
+        total_index = self.__index + slot if slot else self.__index
 
+        for peer_kernel, peer_port, peer_dim in peers:
             # rebalance the indices
-            peer_dim = len(self.__peer_dims[peer_kernel])
             peer_index = total_index[0:peer_dim]
             peer_slot = total_index[peer_dim:]
             endpoints.append(
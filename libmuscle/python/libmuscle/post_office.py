@@ -3,8 +3,6 @@ import time
 from typing import Dict
 
 import msgpack
-from ymmsl import Reference
-
 from libmuscle.mcp.protocol import RequestType
 from libmuscle.mcp.transport_server import RequestHandler
 from libmuscle.outbox import Outbox
@@ -19,7 +17,9 @@ class PostOffice(RequestHandler):
     def __init__(self) -> None:
         """Create a PostOffice.
         """
-        self._outboxes: Dict[Reference, Outbox] = {}
+        # Indexed by receiver. Strings rather than References, because
+        # strings cache their hash and that's what comes in on the wire.
+        self._outboxes: Dict[str, Outbox] = {}
 
         self._outbox_lock = Lock()
 
@@ -39,11 +39,11 @@ class PostOffice(RequestHandler):
         if len(req) != 2 or req[0] != RequestType.GET_NEXT_MESSAGE.value:
             raise RuntimeError(
                     'Invalid request type. Did the streams get crossed?')
-        recv_port = Reference(req[1])
+        recv_port = req[1]
         self._ensure_outbox_exists(recv_port)
         return self._outboxes[recv_port].retrieve()
 
-    def get_message(self, receiver: Reference) -> bytes:
+    def get_message(self, receiver: str) -> bytes:
         """Get a message from a receiver's outbox.
 
         Used by servers to get messages that have been sent to another
@@ -55,15 +55,20 @@ class PostOffice(RequestHandler):
         self._ensure_outbox_exists(receiver)
         return self._outboxes[receiver].retrieve()
 
-    def deposit(self, receiver: Reference, message: bytes) -> None:
-        """Deposits a message into an outbox.
+    def get_outbox(self, receiver: str) -> Outbox:
+        """Get the outbox for a receiver, creating it if needed.
+
+        Messages may be deposited into the returned Outbox directly,
+        which saves looking it up for every message.
 
         Args:
-            receiver: Receiver of the message.
-            message: The message to deposit.
+            receiver: The receiver whose outbox to get.
+
+        Returns:
+            The receiver's outbox.
         """
         self._ensure_outbox_exists(receiver)
-        self._outboxes[receiver].deposit(message)
+        return self._outboxes[receiver]
 
     def wait_for_receivers(self) -> None:
         """Waits until all outboxes are empty.
@@ -72,7 +77,7 @@ class PostOffice(RequestHandler):
             while not outbox.is_empty():
                 time.sleep(0.1)
 
-    def _ensure_outbox_exists(self, receiver: Reference) -> None:
+    def _ensure_outbox_exists(self, receiver: str) -> None:
         """Ensure that an outbox exists.
 
         Outboxes are created dynamically, the first time a message is
@@ -1,8 +1,30 @@
-from typing import List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
 from ymmsl import SettingValue, Reference, Settings
 
 
+def _is_float_list(value: SettingValue) -> bool:
+    # We don't check everything here, the yMMSL loader does a full type
+    # check, so we just need to discriminate.
+    return isinstance(value, list) and (
+            len(value) == 0 or isinstance(value[0], float))
+
+
+def _is_float_list_list(value: SettingValue) -> bool:
+    # See _is_float_list()
+    return isinstance(value, list) and (
+            len(value) == 0 or isinstance(value[0], list))
+
+
+_SETTING_TYPE_CHECKS: Dict[str, Callable[[SettingValue], bool]] = {
+        'str': lambda value: isinstance(value, str),
+        'int': lambda value: isinstance(value, int),
+        'float': lambda value: isinstance(value, float),
+        'bool': lambda value: isinstance(value, bool),
+        '[float]': _is_float_list,
+        '[[float]]': _is_float_list_list}
+
+
 def has_setting_type(value: SettingValue, typ: str) -> bool:
     """Checks whether the value has the given type.
 
@@ -17,30 +39,38 @@ def has_setting_type(value: SettingValue, typ: str) -> bool:
     Raises:
         ValueError: If the type specified is not valid.
     """
-    par_type_to_type = {
-            'str': str,
-            'int': int,
-            'float': float,
-            'bool': bool
-            }
-
-    if typ in par_type_to_type:
-        return isinstance(value, par_type_to_type[typ])
-    elif typ == '[float]':
-        if isinstance(value, list):
-            if len(value) == 0 or isinstance(value[0], float):
-                # We don't check everything here, the yMMSL loader does
-                # a full type check, so we just need to discriminate.
-                return True
-        return False
-    elif typ == '[[float]]':
-        if isinstance(value, list):
-            if len(value) == 0 or isinstance(value[0], list):
-                # We don't check everything here, the yMMSL loader does
-                # a full type check, so we just need to discriminate.
-                return True
-        return False
-    raise ValueError('Invalid setting type specified: {}'.format(typ))
+    check = _SETTING_TYPE_CHECKS.get(typ)
+    if check is None:
+        raise ValueError('Invalid setting type specified: {}'.format(typ))
+    return check(value)
+
+
+class _ObservedSettings(Settings):
+    """Settings that call a function whenever they are changed.
+
+    This lets SettingsManager know when to invalidate its cache.
+    """
+    def __init__(self, settings: Settings, on_change: Callable[[], None]
+                 ) -> None:
+        """Create an _ObservedSettings.
+
+        Args:
+            settings: Settings to make a shallow copy of.
+            on_change: Function to call when a setting is changed.
+        """
+        super().__init__()
+        for key, value in settings.items():
+            self._store[key] = value
+        self.__on_change = on_change
+
+    def __setitem__(self, key: Union[str, Reference], value: SettingValue
+                    ) -> None:
+        super().__setitem__(key, value)
+        self.__on_change()
+
+    def __delitem__(self, key: Union[str, Reference]) -> None:
+        super().__delitem__(key)
+        self.__on_change()
 
 
 class SettingsManager:
@@ -61,9 +91,48 @@ class SettingsManager:
             base: The base layer.
             overlay: The overlay layer.
         """
+        # Found setting names and values, indexed by instance and setting
+        # name, cleared whenever base or overlay changes.
+        self._cache: Dict[
+                Tuple[Reference, Reference],
+                Tuple[Reference, SettingValue]] = {}
+
+        # Names to look for, most specific first, indexed by instance and
+        # setting name. These don't depend on the settings, so they're
+        # kept when the cache above is cleared.
+        self._candidates: Dict[
+                Tuple[Reference, Reference], List[Reference]] = {}
+
         self.base = Settings()
         self.overlay = Settings()
 
+    @property
+    def base(self) -> Settings:
+        """The base layer.
+
+        Assigning to this makes a shallow copy of the given Settings.
+        """
+        return self._base
+
+    @base.setter
+    def base(self, settings: Settings) -> None:
+        self._base: Settings = _ObservedSettings(settings, self.__clear_cache)
+        self.__clear_cache()
+
+    @property
+    def overlay(self) -> Settings:
+        """The overlay layer.
+
+        Assigning to this makes a shallow copy of the given Settings.
+        """
+        return self._overlay
+
+    @overlay.setter
+    def overlay(self, settings: Settings) -> None:
+        self._overlay: Settings = _ObservedSettings(
+                settings, self.__clear_cache)
+        self.__clear_cache()
+
     def list_settings(self, instance_id: Reference) -> List[str]:
         """Returns the names of all the settings.
 
@@ -123,21 +192,30 @@ class SettingsManager:
                     not match `typ`.
             ValueError: If an invalid value was specified for `typ`
         """
-        for i in range(len(instance), -1, -1):
-            if i > 0:
-                name = instance[:i] + setting_name
-            else:
-                name = setting_name
-
-            if name in self.overlay:
-                value = self.overlay[name]
-                break
-            elif name in self.base:
-                value = self.base[name]
-                break
+        key = (instance, setting_name)
+        found = self._cache.get(key)
+        if found is not None:
+            name, value = found
         else:
-            raise KeyError(('Value for setting "{}" was not set.'.format(
-                setting_name)))
+            candidates = self._candidates.get(key)
+            if candidates is None:
+                candidates = [
+                        instance[:i] + setting_name
+                        for i in range(len(instance), 0, -1)]
+                candidates.append(setting_name)
+                self._candidates[key] = candidates
+
+            for name in candidates:
+                if name in self._overlay:
+                    value = self._overlay[name]
+                    break
+                elif name in self._base:
+                    value = self._base[name]
+                    break
+            else:
+                raise KeyError(('Value for setting "{}" was not set.'.format(
+                    setting_name)))
+            self._cache[key] = name, value
 
         if typ is not None:
             if not has_setting_type(value, typ):
@@ -145,3 +223,10 @@ class SettingsManager:
                                 ' where {} was expected.'.format(
                                     name, type(value), typ))
         return value
+
+    def __clear_cache(self) -> None:
+        """Clears the cache of found settings.
+
+        Called whenever base or overlay is changed.
+        """
+        self._cache.clear()
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, Optional, Union, cast
 
 import msgpack
 from ymmsl import Reference, Settings
@@ -34,7 +34,7 @@ class Snapshot(ABC):
 
     @classmethod
     @abstractmethod
-    def from_bytes(cls, data: bytes) -> 'Snapshot':
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> 'Snapshot':
         """Create a snapshot object from binary data.
 
         Args:
@@ -60,7 +60,7 @@ class MsgPackSnapshot(Snapshot):
     SNAPSHOT_VERSION_BYTE = b'1'
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> 'Snapshot':
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> 'Snapshot':
         dct = msgpack.loads(data)
         return cls(dct['triggers'],
                    dct['wallclock_time'],
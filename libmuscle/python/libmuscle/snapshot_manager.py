@@ -1,4 +1,6 @@
 import logging
+import mmap
+import os
 from pathlib import Path
 from typing import cast, List, Optional
 
@@ -17,6 +19,10 @@ _NO_MESSAGE_PROVIDED = (
         'Invalid message provided to `{}`. Please create a Message object to'
         ' store the state of the instance in a snapshot.')
 
+# replace identifier[i] by identifier-i to use in snapshot file name
+# using a dash (-) because that is not allowed in Identifiers
+_SAFE_ID_TABLE = str.maketrans({'[': '-', ']': None})
+
 
 class SnapshotManager:
     """Manages information on snapshots for the Instance
@@ -36,9 +42,7 @@ class SnapshotManager:
             communicator: The communicator belonging to this instance.
         """
         self._instance_id = instance_id
-        # replace identifier[i] by identifier-i to use in snapshot file name
-        # using a dash (-) because that is not allowed in Identifiers
-        self._safe_id = str(instance_id).replace("[", "-").replace("]", "")
+        self._safe_id = str(instance_id).translate(_SAFE_ID_TABLE)
         self._communicator = communicator
         self._manager = manager
 
@@ -66,6 +70,7 @@ class SnapshotManager:
         """
         result: Optional[float] = None
         self._snapshot_directory = snapshot_directory or Path.cwd()
+        self.__find_next_snapshot_num()
         if resume_snapshot is not None:
             snapshot = self.load_snapshot_from_file(resume_snapshot)
 
@@ -134,10 +139,9 @@ class SnapshotManager:
             # Decrease F_INIT port counts by one: F_INIT messages are already
             # pre-received, but not yet processed by the user code. Therefore,
             # the snapshot state should treat these as not-received.
-            all_ports = self._communicator.list_ports()
-            ports = all_ports.get(Operator.F_INIT, [])
+            ports = self._communicator.list_ports().get(Operator.F_INIT, [])
             if self._communicator.settings_in_connected():
-                ports.append('muscle_settings_in')
+                ports = [*ports, 'muscle_settings_in']
             for port_name in ports:
                 new_counts = [i - 1 for i in port_message_counts[port_name]]
                 port_message_counts[port_name] = new_counts
@@ -173,15 +177,48 @@ class SnapshotManager:
         # TODO: encapsulate I/O errors?
         with snapshot_location.open('rb') as snapshot_file:
             version = snapshot_file.read(1)
-            data = snapshot_file.read()
-
-            if version == MsgPackSnapshot.SNAPSHOT_VERSION_BYTE:
+            if version != MsgPackSnapshot.SNAPSHOT_VERSION_BYTE:
+                raise RuntimeError('Unable to load snapshot from'
+                                   f' {snapshot_location}: unknown version of'
+                                   ' snapshot file. Was the file saved with a'
+                                   ' different version of libmuscle or'
+                                   ' edited?')
+
+            # Map the file rather than reading it, this saves making a copy
+            # of what may be a large amount of data.
+            try:
+                mapped = mmap.mmap(
+                        snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Not supported for this file, so read it after all
+                return MsgPackSnapshot.from_bytes(snapshot_file.read())
+
+        with mapped:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped)[1:] as data:
                 return MsgPackSnapshot.from_bytes(data)
-            raise RuntimeError('Unable to load snapshot from'
-                               f' {snapshot_location}: unknown version of'
-                               ' snapshot file. Was the file saved with a'
-                               ' different version of libmuscle or'
-                               ' edited?')
+
+    def __find_next_snapshot_num(self) -> None:
+        """Set the next snapshot number to follow any existing snapshots.
+
+        This avoids trying to create each existing file in turn if
+        there are snapshots from a previous run in the directory.
+        """
+        prefix = f'{self._safe_id}_'
+        last_num = 0
+        try:
+            with os.scandir(self._snapshot_directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith('.pack'):
+                        num = name[len(prefix):-len('.pack')]
+                        if num.isdecimal():
+                            last_num = max(last_num, int(num))
+        except OSError:
+            # Creating the files will fail too, and report this
+            pass
+        self._next_snapshot_num = max(self._next_snapshot_num, last_num + 1)
 
     def __store_snapshot(self, snapshot: Snapshot) -> Path:
         """Store a snapshot on the filesystem.
@@ -200,16 +237,19 @@ class SnapshotManager:
             fname = f"{self._safe_id}_{self._next_snapshot_num}.pack"
             fpath = self._snapshot_directory / fname
             self._next_snapshot_num += 1
-            if not fpath.exists():
+            # Opening with mode 'x' fails if the file exists, so we never
+            # overwrite an existing file, and need not check beforehand.
+            try:
+                snapshot_file = fpath.open('xb')
                 break
+            except FileExistsError:
+                pass
         else:
             raise RuntimeError('Could not find an available filename for'
                                f' storing the next snapshot: {fpath} already'
                                ' exists.')
-        # Opening with mode 'x' since a file with the same name may be created
-        # in the small window between checking above and opening here. It is
-        # better to fail with an error than to overwrite an existing file.
-        with fpath.open('xb') as snapshot_file:
-            snapshot_file.write(snapshot.SNAPSHOT_VERSION_BYTE)
-            snapshot_file.write(snapshot.to_bytes())
+        with snapshot_file:
+            # A single write, so that large snapshots go to the OS in one go
+            snapshot_file.write(
+                    snapshot.SNAPSHOT_VERSION_BYTE + snapshot.to_bytes())
         return fpath
@@ -152,14 +152,17 @@ def communicator3() -> Communicator:
 def test_create_communicator(communicator) -> None:
     assert str(communicator._kernel) == 'kernel'
     assert communicator._index == [13]
-    assert len(communicator._servers) == 1
+    assert communicator._servers == []
     assert communicator._clients == {}
     assert communicator._post_office._outboxes == {}
 
 
 def test_get_locations(communicator) -> None:
-    assert len(communicator.get_locations()) == 1
-    assert communicator.get_locations()[0].startswith('tcp:')
+    locations = communicator.get_locations()
+    assert len(locations) == 2
+    assert locations[0].startswith('tcp:')
+    assert locations[1].startswith('unix:')
+    assert len(communicator._servers) == 2
 
 
 def test_connect() -> None:
@@ -291,6 +294,39 @@ def test_send_message(communicator, message) -> None:
     assert msg.data == b'test'
 
 
+def test_send_message_settings_overlay(communicator) -> None:
+    overlay = Settings({'test': 13})
+    communicator.send_message(
+            'out', Message(0.0, None, b'test'), settings_overlay=overlay)
+    msg = MPPMessage.from_bytes(communicator._post_office._outboxes[
+            'other.in[13]']._Outbox__queue.get())
+    assert msg.settings_overlay == overlay
+
+    message_settings = Settings({'test': 14})
+    communicator.send_message(
+            'out', Message(0.0, None, b'test', message_settings),
+            settings_overlay=overlay)
+    msg = MPPMessage.from_bytes(communicator._post_office._outboxes[
+            'other.in[13]']._Outbox__queue.get())
+    assert msg.settings_overlay == message_settings
+
+
+def test_send_message_caches_endpoints(communicator, message) -> None:
+    pm = communicator._peer_manager
+    pm.get_peer_endpoints = MagicMock(side_effect=pm.get_peer_endpoints)
+
+    communicator.send_message('out', message)
+    communicator.send_message('out', message)
+
+    pm.get_peer_endpoints.assert_called_once()
+    assert communicator._post_office._outboxes[
+            'other.in[13]']._Outbox__queue.qsize() == 2
+
+    # empty post office
+    communicator._post_office.get_message('other.in[13]')
+    communicator._post_office.get_message('other.in[13]')
+
+
 def test_send_on_disconnected_port(communicator, message) -> None:
     communicator._peer_manager.is_connected.return_value = False
     communicator.send_message('not_connected', message)
@@ -330,6 +366,14 @@ def test_send_message_with_slot(communicator2, message) -> None:
     assert msg.data == b'test'
 
 
+def test_send_message_invalid_slot(communicator2, message) -> None:
+    with pytest.raises(RuntimeError):
+        communicator2.send_message('out', message, 100)
+
+    assert communicator2.get_message_counts()['out'] == [0] * 20
+    assert 'kernel[13].in' not in communicator2._post_office._outboxes
+
+
 def test_send_message_resizable(communicator3, message) -> None:
     with pytest.raises(RuntimeError):
         communicator3.send_message('out', message, 13)
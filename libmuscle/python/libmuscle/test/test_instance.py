@@ -170,7 +170,7 @@ def test_send(instance, message):
     instance._trigger_manager._cpts_considered_until = 17.0
     instance.send('out', message, 1)
     assert instance._communicator.send_message.called_with(
-            'out', message, 1, 17.0)
+            'out', message, 1, 17.0, instance._settings_manager.overlay)
 
 
 def test_send_invalid_port(instance, message):
@@ -194,7 +194,6 @@ def test_receive(instance):
 
 
 def test_receive_default(instance):
-    instance._communicator.port_exists.return_value = True
     port = instance._communicator.get_port.return_value
     port.operator = Operator.F_INIT
     port.is_connected.return_value = False
@@ -206,7 +205,7 @@ def test_receive_default(instance):
 
 
 def test_receive_invalid_port(instance):
-    instance._communicator.port_exists.return_value = False
+    instance._communicator.get_port.side_effect = KeyError
     with pytest.raises(RuntimeError):
         instance.receive('does_not_exist', 1)
 
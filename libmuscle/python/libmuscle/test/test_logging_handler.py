@@ -0,0 +1,35 @@
+import logging
+from unittest.mock import MagicMock
+
+from libmuscle.logging import LogLevel
+from libmuscle.logging_handler import MuscleManagerHandler
+
+
+def make_record(text: str) -> logging.LogRecord:
+    return logging.LogRecord(
+            'test', logging.WARNING, __file__, 1, text, None, None)
+
+
+def test_batching() -> None:
+    client = MagicMock()
+    handler = MuscleManagerHandler('instance', logging.WARNING, client)
+
+    handler.emit(make_record('message 1'))
+    handler.emit(make_record('message 2'))
+    handler.flush()
+
+    sent = [
+            message
+            for call in client.submit_log_messages.call_args_list
+            for message in call[0][0]]
+    assert [m.text for m in sent] == ['message 1', 'message 2']
+    assert all(m.instance_id == 'instance' for m in sent)
+    assert all(m.level == LogLevel.WARNING for m in sent)
+    client.submit_log_message.assert_not_called()
+
+    handler.close()
+    assert not handler._thread.is_alive()
+
+    handler.emit(make_record('message 3'))
+    client.submit_log_message.assert_called_once()
+    assert client.submit_log_message.call_args[0][0].text == 'message 3'
@@ -49,6 +49,34 @@ def test_submit_log_message(mocked_mmp_client, profile_data) -> None:
             'Testing the MMPClient']
 
 
+def test_submit_log_messages(mocked_mmp_client, profile_data) -> None:
+    client, stub = mocked_mmp_client
+    result = [ResponseType.SUCCESS.value]
+    stub.call.return_value = (
+            msgpack.packb(result, use_bin_type=True), profile_data)
+
+    messages = [
+            LogMessage(
+                'test_mmp_client', Timestamp(1.0), LogLevel.WARNING,
+                'Testing the MMPClient'),
+            LogMessage(
+                'test_mmp_client', Timestamp(2.0), LogLevel.ERROR,
+                'Testing it again')]
+
+    client.submit_log_messages(messages)
+    assert stub.call.called
+
+    sent_request = stub.call.call_args[0][0]
+    decoded_request = msgpack.unpackb(sent_request, raw=False)
+
+    assert decoded_request == [
+            RequestType.SUBMIT_LOG_MESSAGES.value, [
+                ['test_mmp_client', 1.0, LogLevel.WARNING.value,
+                 'Testing the MMPClient'],
+                ['test_mmp_client', 2.0, LogLevel.ERROR.value,
+                 'Testing it again']]]
+
+
 def test_get_settings(mocked_mmp_client, profile_data) -> None:
     client, stub = mocked_mmp_client
 
@@ -6,7 +6,7 @@ import numpy as np
 from ymmsl import Reference, Settings
 
 from libmuscle.grid import Grid
-from libmuscle.mpp_message import MPPMessage
+from libmuscle.mpp_message import MPPMessage, _packers
 
 
 def test_create() -> None:
@@ -32,6 +32,42 @@ def test_create() -> None:
     assert msg.data == data
 
 
+def test_encoded_for() -> None:
+    sender = Reference('sender.port')
+    receivers = ['receiver1.port', 'receiver2.port[3]']
+    settings = Settings({'test': 12.3})
+    msg = MPPMessage(
+            sender, Reference(receivers[0]), 10, 1.0, None, settings, 4, 0.5,
+            {'key': 'value'})
+
+    encoded = msg.encoded_for(receivers)
+    assert len(encoded) == 2
+    assert encoded[0] == msg.encoded()
+
+    for receiver, enc in zip(receivers, encoded):
+        decoded = MPPMessage.from_bytes(enc)
+        assert decoded.sender == sender
+        assert decoded.receiver == receiver
+        assert decoded.port_length == 10
+        assert decoded.timestamp == 1.0
+        assert decoded.next_timestamp is None
+        assert decoded.settings_overlay == settings
+        assert decoded.message_number == 4
+        assert decoded.saved_until == 0.5
+        assert decoded.data == {'key': 'value'}
+
+    assert msgpack.unpackb(encoded[1], raw=False, ext_hook=lambda c, d: d) == {
+            'sender': 'sender.port',
+            'receiver': 'receiver2.port[3]',
+            'port_length': 10,
+            'timestamp': 1.0,
+            'next_timestamp': None,
+            'settings_overlay': msgpack.packb({'test': 12.3}),
+            'message_number': 4,
+            'saved_until': 0.5,
+            'data': {'key': 'value'}}
+
+
 def test_grid_encode() -> None:
     sender = Reference('sender.port')
     receiver = Reference('receiver.port')
@@ -188,3 +224,23 @@ def test_non_contiguous_grid_roundtrip() -> None:
     assert grid_out.array.size == 12
     assert grid_out.array[1, 0, 1] == 8.0
     assert grid_out.array[0, 0, 2] == 3.0
+
+
+def test_large_message_packer_replaced() -> None:
+    sender = Reference('sender.port')
+    receiver = Reference('receiver.port')
+
+    msg = MPPMessage(
+            sender, receiver, None, 0.0, None, Settings(), 0, 0.0, b'x')
+    msg.encoded()
+    packer = _packers.message
+    msg.encoded()
+    assert _packers.message is packer
+
+    # don't keep a large buffer around after encoding a large message
+    msg.data = Grid(np.zeros(1000000))
+    wire_data = msg.encoded()
+    assert _packers.message is not packer
+
+    msg_out = MPPMessage.from_bytes(wire_data)
+    assert msg_out.data.array.shape == (1000000,)
@@ -111,3 +111,28 @@ def test_get_setting(settings_manager):
                                         ) == 'base_test5'
     assert settings_manager.get_setting(ref('instance[11]'), ref('test5')
                                         ) == 'overlay_test5'
+
+
+def test_get_setting_cache(settings_manager):
+    ref = Reference
+    settings_manager.base[ref('test1')] = 'base'
+    assert settings_manager.get_setting(ref('instance'), ref('test1')) == \
+        'base'
+
+    settings_manager.overlay[ref('test1')] = 'overlay'
+    assert settings_manager.get_setting(ref('instance'), ref('test1')) == \
+        'overlay'
+
+    del settings_manager.overlay[ref('test1')]
+    assert settings_manager.get_setting(ref('instance'), ref('test1')) == \
+        'base'
+
+    settings = Settings()
+    settings[ref('test1')] = 'new_base'
+    settings_manager.base = settings
+    assert settings_manager.get_setting(ref('instance'), ref('test1')) == \
+        'new_base'
+
+    settings_manager.base = Settings()
+    with pytest.raises(KeyError):
+        settings_manager.get_setting(ref('instance'), ref('test1'))
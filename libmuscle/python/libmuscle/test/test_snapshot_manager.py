@@ -114,3 +114,23 @@ def test_save_load_implicit_snapshot(tmp_path: Path) -> None:
     snapshot_manager2.save_snapshot(
             None, True, ['implicit'], 12.3, 2.5, Settings())
     manager.submit_snapshot_metadata.assert_called_once()
+
+
+def test_skip_existing_snapshots(tmp_path: Path) -> None:
+    for name in ['test-1_1.pack', 'test-1_7.pack', 'test-1_x.pack',
+                 'test-1_2_3.pack', 'test-1_\u00b2.pack', 'test-12_9.pack']:
+        (tmp_path / name).touch()
+
+    manager = MagicMock()
+    communicator = MagicMock()
+    communicator.get_message_counts.return_value = {}
+    snapshot_manager = SnapshotManager(
+            Reference('test[1]'), manager, communicator)
+    snapshot_manager.prepare_resume(None, tmp_path)
+
+    snapshot_manager.save_snapshot(
+            Message(0.2, None, 'test data'), False, ['test'], 13.0, None,
+            Settings())
+
+    metadata, = manager.submit_snapshot_metadata.call_args[0]
+    assert Path(metadata.snapshot_filename).name == 'test-1_8.pack'
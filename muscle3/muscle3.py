@@ -215,7 +215,7 @@ def _load_ymmsl_files(ymmsl_files: Sequence[str]) -> PartialConfiguration:
     """Loads and merges yMMSL files."""
     configuration = PartialConfiguration()
     for path in ymmsl_files:
-        with open(path, 'r') as f:
+        with open(path, 'rb') as f:
             configuration.update(ymmsl.load(f))
     return configuration
 
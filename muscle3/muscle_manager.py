@@ -3,17 +3,14 @@ from pathlib import Path
 import sys
 import textwrap
 import traceback
-from typing import Optional, Sequence
+from typing import Optional, Sequence, TYPE_CHECKING
 
 import click
-from ruamel.yaml.scanner import ScannerError
-from yatiml import RecognitionError
-import ymmsl
-from ymmsl import Identifier, PartialConfiguration
 
-from libmuscle.manager.logger import last_lines
-from libmuscle.manager.manager import Manager
-from libmuscle.manager.run_dir import RunDir
+# The modules below are slow to import, so that is done when they are
+# needed, and not when just showing the help text.
+if TYPE_CHECKING:
+    from ymmsl import PartialConfiguration
 
 
 @click.command(no_args_is_help=True)
@@ -77,6 +74,13 @@ def manage_simulation(
     times, then the value in the last file in the list to mention it is
     used.
     """
+    import ymmsl
+    from ymmsl import Identifier, PartialConfiguration
+
+    from libmuscle.manager.logger import last_lines
+    from libmuscle.manager.manager import Manager
+    from libmuscle.manager.run_dir import RunDir
+
     configuration = PartialConfiguration()
     for path in ymmsl_files:
         configuration.update(load_configuration(path))
@@ -155,12 +159,17 @@ def manage_simulation(
     sys.exit(0 if success else 1)
 
 
-def load_configuration(path: str) -> PartialConfiguration:
+def load_configuration(path: str) -> 'PartialConfiguration':
     """Load and parse a configuration file.
 
     Annotates error messages for easier debugging by users.
     """
-    with open(path, 'r') as f:
+    from ruamel.yaml.scanner import ScannerError
+    from yatiml import RecognitionError
+    import ymmsl
+
+    # The YAML reader detects the encoding itself, so give it bytes
+    with open(path, 'rb') as f:
         try:
             return ymmsl.load(f)
         except ScannerError as exc:  # capture ruamel.yaml errors